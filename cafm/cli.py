@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 
 from rich.console import Console
 from rich.panel import Panel
@@ -10,8 +11,10 @@ from rich.table import Table
 from rich.prompt import Prompt, IntPrompt, Confirm
 
 from cafm.config_manager import ConfigManager
-from cafm.ollama_client import list_local_models, validate_models, pull_model
-from cafm.debate_engine import DebateEngine
+
+# cafm.ollama_client and cafm.debate_engine pull in the ollama/httpx/pydantic
+# stack, which costs far more than the rest of start-up. They are imported
+# inside the functions that need them so the banner renders first.
 
 console = Console()
 
@@ -32,23 +35,54 @@ def show_banner() -> None:
 
 def show_status(cfg: ConfigManager) -> None:
     """Display current configuration summary."""
+    snapshot = (
+        cfg.instances,
+        cfg.rounds,
+        cfg.models_signature,
+        cfg.skeptic_agent,
+        cfg.context_limit,
+        cfg.context_strategy,
+        cfg.data.get("stream_output", True),
+        cfg.data.get("save_logs", True),
+        cfg.data.get("parallel_agents", False),
+    )
+    console.out(_render_status(snapshot, console.width), end="", highlight=False)
+
+
+@lru_cache(maxsize=8)
+def _render_status(snapshot: tuple, width: int) -> str:
+    """Render the status table for a config snapshot to a terminal string.
+
+    Cached so that re-showing an unchanged configuration skips Rich's markup
+    parsing and table layout. *width* is part of the key because the
+    rendered output depends on it.
+    """
+    instances, rounds, models, skeptic, ctx_limit, strategy, stream, save_logs, parallel = snapshot
     table = Table(title="Current Configuration", show_header=False, border_style="cyan")
     table.add_column("Key", style="bold")
     table.add_column("Value")
-    table.add_row("Instances", str(cfg.instances))
-    table.add_row("Rounds", str(cfg.rounds))
-    skeptic_on = cfg.skeptic_agent and cfg.instances > 1
-    for i, m in enumerate(cfg.models[: cfg.instances], 1):
-        is_sk = skeptic_on and i == cfg.instances
-        label = f"  Agent {i} Model"
-        value = f"{m}  [bold red]⚡ SKEPTIC[/bold red]" if is_sk else m
-        table.add_row(label, value)
-    table.add_row("Skeptic Agent", "[bold green]ON[/bold green]" if skeptic_on else "[dim]OFF[/dim]")
-    table.add_row("Context Limit", f"{cfg.context_limit} tokens")
-    table.add_row("Context Strategy", cfg.context_strategy)
-    table.add_row("Stream Output", str(cfg.data.get("stream_output", True)))
-    table.add_row("Save Logs", str(cfg.data.get("save_logs", True)))
-    console.print(table)
+    skeptic_on = skeptic and instances > 1
+    sk_tag = "  [bold red]⚡ SKEPTIC[/bold red]"
+    agent_rows = [
+        (f"  Agent {i} Model", m + sk_tag if skeptic_on and i == instances else m)
+        for i, m in enumerate(models, 1)
+    ]
+    rows = [
+        ("Instances", str(instances)),
+        ("Rounds", str(rounds)),
+        *agent_rows,
+        ("Skeptic Agent", "[bold green]ON[/bold green]" if skeptic_on else "[dim]OFF[/dim]"),
+        ("Context Limit", f"{ctx_limit} tokens"),
+        ("Context Strategy", strategy),
+        ("Stream Output", str(stream)),
+        ("Save Logs", str(save_logs)),
+        ("Parallel Agents", str(parallel)),
+    ]
+    for row in rows:
+        table.add_row(*row)
+    with console.capture() as capture:
+        console.print(table)
+    return capture.get()
 
 
 def validate_and_fix_models(cfg: ConfigManager) -> bool:
@@ -56,6 +90,14 @@ def validate_and_fix_models(cfg: ConfigManager) -> bool:
 
     Returns True if all models are ready, False if unrecoverable.
     """
+    from cafm.ollama_client import (
+        list_local_models,
+        pull_model,
+        refresh_local_models,
+        validate_models,
+    )
+
+    refresh_local_models()
     models_needed = cfg.models[: cfg.instances]
     available, missing = validate_models(models_needed)
 
@@ -121,69 +163,91 @@ def _pick_model_by_number(model_list: list[str], prompt_label: str = "Select mod
 # Settings Menu
 # ------------------------------------------------------------------
 
+_MENU_TEMPLATE = (
+    "  [1] Set number of instances\n"
+    "  [2] Set number of rounds\n"
+    "  [3] Assign models to instances\n"
+    "  [4] Set context limit\n"
+    "  [5] Toggle context strategy (sliding_window / summary)\n"
+    "  [6] Toggle stream output\n"
+    "  [7] Toggle save logs\n"
+    "  [8] Toggle skeptic agent (last agent refutes others) — currently {skeptic_state}\n"
+    "  [9] Toggle parallel agents (peers in a round answer at once) — currently {parallel_state}\n"
+    "  [0] Back to main menu\n"
+)
+_MENU_CHOICES = [str(i) for i in range(10)]
+
+
 def settings_menu(cfg: ConfigManager) -> None:
-    """Interactive settings editor."""
-    while True:
-        console.print()
-        console.rule("[bold]Settings Menu[/bold]")
-        console.print("  [1] Set number of instances")
-        console.print("  [2] Set number of rounds")
-        console.print("  [3] Assign models to instances")
-        console.print("  [4] Set context limit")
-        console.print("  [5] Toggle context strategy (sliding_window / summary)")
-        console.print("  [6] Toggle stream output")
-        console.print("  [7] Toggle save logs")
-        sk_state = "[bold green]ON[/bold green]" if cfg.skeptic_agent else "[dim]OFF[/dim]"
-        console.print(f"  [8] Toggle skeptic agent (last agent refutes others) — currently {sk_state}")
-        console.print("  [0] Back to main menu")
-        console.print()
+    """Interactive settings editor.
 
-        choice = Prompt.ask("Select option", choices=["0","1","2","3","4","5","6","7","8"], default="0")
-
-        if choice == "0":
-            break
-        elif choice == "1":
-            n = IntPrompt.ask("Number of instances (agents)", default=cfg.instances)
-            cfg.set("instances", max(1, n))
-            cfg.ensure_models_match_instances()
-        elif choice == "2":
-            r = IntPrompt.ask("Number of rounds", default=cfg.rounds)
-            cfg.set("rounds", max(1, r))
-        elif choice == "3":
-            local = list_local_models()
-            if not local:
-                console.print("[red]No models found in Ollama. Pull some first.[/red]")
-                continue
-            for i in range(cfg.instances):
-                current = cfg.models[i] if i < len(cfg.models) else "—"
-                console.print(f"\n  Agent {i+1} (current: [bold]{current}[/bold])")
-                picked = _pick_model_by_number(local, f"  Agent {i+1} model")
-                if picked:
-                    cfg.set_model_at(i, picked)
-                    console.print(f"  [green]Agent {i+1} → {picked}[/green]")
-        elif choice == "4":
-            lim = IntPrompt.ask("Context token limit", default=cfg.context_limit)
-            cfg.set("context_limit", max(512, lim))
-        elif choice == "5":
-            cur = cfg.context_strategy
-            new = "summary" if cur == "sliding_window" else "sliding_window"
-            cfg.set("context_strategy", new)
-            console.print(f"  Strategy changed to: [bold]{new}[/bold]")
-        elif choice == "6":
-            cur = cfg.data.get("stream_output", True)
-            cfg.set("stream_output", not cur)
-            console.print(f"  Stream output: [bold]{not cur}[/bold]")
-        elif choice == "7":
-            cur = cfg.data.get("save_logs", True)
-            cfg.set("save_logs", not cur)
-            console.print(f"  Save logs: [bold]{not cur}[/bold]")
-        elif choice == "8":
-            cur = cfg.skeptic_agent
-            cfg.set("skeptic_agent", not cur)
-            state = "[bold green]ON[/bold green]" if not cur else "[dim]OFF[/dim]"
-            console.print(f"  Skeptic agent: {state}")
-            if not cur and cfg.instances < 2:
-                console.print("  [yellow]Note: needs at least 2 agents to have a skeptic.[/yellow]")
+    Changes are written to disk once, when the menu is closed.
+    """
+    with cfg.batch():
+        while True:
+            console.print()
+            console.rule("[bold]Settings Menu[/bold]")
+            sk_state = "[bold green]ON[/bold green]" if cfg.skeptic_agent else "[dim]OFF[/dim]"
+            par_state = (
+                "[bold green]ON[/bold green]" if cfg.data.get("parallel_agents", False)
+                else "[dim]OFF[/dim]"
+            )
+            console.print(_MENU_TEMPLATE.format(skeptic_state=sk_state, parallel_state=par_state))
+
+            choice = Prompt.ask("Select option", choices=_MENU_CHOICES, default="0")
+
+            if choice == "0":
+                break
+            elif choice == "1":
+                n = IntPrompt.ask("Number of instances (agents)", default=cfg.instances)
+                cfg.set("instances", max(1, n))
+                cfg.ensure_models_match_instances()
+            elif choice == "2":
+                r = IntPrompt.ask("Number of rounds", default=cfg.rounds)
+                cfg.set("rounds", max(1, r))
+            elif choice == "3":
+                from cafm.ollama_client import list_local_models, refresh_local_models
+
+                refresh_local_models()
+                local = list_local_models()
+                if not local:
+                    console.print("[red]No models found in Ollama. Pull some first.[/red]")
+                    continue
+                for i in range(cfg.instances):
+                    current = cfg.models[i] if i < len(cfg.models) else "—"
+                    console.print(f"\n  Agent {i+1} (current: [bold]{current}[/bold])")
+                    picked = _pick_model_by_number(local, f"  Agent {i+1} model")
+                    if picked:
+                        cfg.set_model_at(i, picked)
+                        console.print(f"  [green]Agent {i+1} → {picked}[/green]")
+            elif choice == "4":
+                lim = IntPrompt.ask("Context token limit", default=cfg.context_limit)
+                cfg.set("context_limit", max(512, lim))
+            elif choice == "5":
+                cur = cfg.context_strategy
+                new = "summary" if cur == "sliding_window" else "sliding_window"
+                cfg.set("context_strategy", new)
+                console.print(f"  Strategy changed to: [bold]{new}[/bold]")
+            elif choice == "6":
+                cur = cfg.data.get("stream_output", True)
+                cfg.set("stream_output", not cur)
+                console.print(f"  Stream output: [bold]{not cur}[/bold]")
+            elif choice == "7":
+                cur = cfg.data.get("save_logs", True)
+                cfg.set("save_logs", not cur)
+                console.print(f"  Save logs: [bold]{not cur}[/bold]")
+            elif choice == "8":
+                cur = cfg.skeptic_agent
+                cfg.set("skeptic_agent", not cur)
+                state = "[bold green]ON[/bold green]" if not cur else "[dim]OFF[/dim]"
+                console.print(f"  Skeptic agent: {state}")
+                if not cur and cfg.instances < 2:
+                    console.print("  [yellow]Note: needs at least 2 agents to have a skeptic.[/yellow]")
+            elif choice == "9":
+                cur = cfg.data.get("parallel_agents", False)
+                cfg.set("parallel_agents", not cur)
+                state = "[bold green]ON[/bold green]" if not cur else "[dim]OFF[/dim]"
+                console.print(f"  Parallel agents: {state}")
 
     show_status(cfg)
 
@@ -208,25 +272,34 @@ def main_loop() -> None:
     cfg.ensure_models_match_instances()
     console.print("\n[bold green]System Ready.[/bold green]\n")
 
+    from cafm.debate_engine import DebateEngine
+
     engine = DebateEngine(cfg)
 
-    while True:
-        console.print("[bold cyan]Commands:[/bold cyan] type a query to start a debate, "
-                       "[bold]/settings[/bold] to configure, [bold]/quit[/bold] to exit.\n")
-        user_input = Prompt.ask("[bold]Enter your query[/bold]").strip()
-
-        if not user_input:
-            continue
-        if user_input.lower() in ("/quit", "/exit", "/q"):
-            console.print("[dim]Goodbye![/dim]")
-            break
-        if user_input.lower() in ("/settings", "/config", "/s"):
-            settings_menu(cfg)
-            # Re-validate after settings change
-            validate_and_fix_models(cfg)
-            cfg.ensure_models_match_instances()
-            engine = DebateEngine(cfg)
-            continue
-
-        engine.run(user_input)
-        console.print()
+    try:
+        while True:
+            console.print("[bold cyan]Commands:[/bold cyan] type a query to start a debate, "
+                           "[bold]/settings[/bold] to configure, [bold]/quit[/bold] to exit.\n")
+            user_input = Prompt.ask("[bold]Enter your query[/bold]").strip()
+
+            if not user_input:
+                continue
+            if user_input.lower() in ("/quit", "/exit", "/q"):
+                console.print("[dim]Goodbye![/dim]")
+                break
+            if user_input.lower() in ("/settings", "/config", "/s"):
+                models_before = cfg.models_signature
+                settings_menu(cfg)
+                # Re-validate only if the settings touched the models in use
+                if cfg.models_signature != models_before:
+                    validate_and_fix_models(cfg)
+                cfg.ensure_models_match_instances()
+                engine.wait_for_log()
+                engine = DebateEngine(cfg)
+                continue
+
+            engine.run(user_input)
+            console.print()
+    finally:
+        # Finish (and report on) the last session log before exiting.
+        engine.wait_for_log()
@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import json
-import copy
+import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+try:  # optional: faster JSON encode/decode
+    import orjson
+except ImportError:
+    orjson = None
 
 DEFAULT_CONFIG: dict[str, Any] = {
     "instances": 3,
@@ -18,6 +24,9 @@ DEFAULT_CONFIG: dict[str, Any] = {
     "save_logs": True,
     "log_directory": "logs",
     "skeptic_agent": True,
+    "parallel_agents": False,
+    "warm_up_models": False,
+    "keep_alive": "30m",  # how long Ollama keeps models loaded; None = server default
     "system_prompts": {
         "initial_round": (
             "You are an expert analyst participating in a multi-agent debate. "
@@ -60,12 +69,53 @@ DEFAULT_CONFIG: dict[str, Any] = {
 CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.json"
 
 
+def _dumps(obj: Any) -> bytes:
+    """Serialize *obj* as indented UTF-8 JSON (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _clone_default_config() -> dict[str, Any]:
+    """Private copy of DEFAULT_CONFIG; copies only its mutable members."""
+    return {
+        **DEFAULT_CONFIG,
+        "models": list(DEFAULT_CONFIG["models"]),
+        "system_prompts": dict(DEFAULT_CONFIG["system_prompts"]),
+    }
+
+
+def _loads(raw: bytes) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class ConfigManager:
     """Manages loading, merging, and saving of CAFM configuration."""
 
+    __slots__ = (
+        "path",
+        "_data",
+        "_prompts_cache",
+        "_batch",
+        "_dirty",
+        "_last_written_hash",
+        "_instances",
+        "_rounds",
+        "_context_limit",
+        "_context_strategy",
+        "_skeptic_agent",
+    )
+
     def __init__(self, path: Path | str | None = None) -> None:
         self.path = Path(path) if path else CONFIG_PATH
         self._data: dict[str, Any] = {}
+        self._prompts_cache: dict[str, str] | None = None
+        self._batch = 0
+        self._dirty = False
+        self._last_written_hash: int | None = None
         self.load()
 
     # ------------------------------------------------------------------
@@ -74,32 +124,66 @@ class ConfigManager:
 
     def load(self) -> dict[str, Any]:
         """Load config from disk, falling back to defaults for missing keys."""
-        base = copy.deepcopy(DEFAULT_CONFIG)
+        base = _clone_default_config()
         if self.path.exists():
             try:
-                with open(self.path, "r", encoding="utf-8") as fh:
-                    user_cfg = json.load(fh)
+                raw = self.path.read_bytes()
+                user_cfg = _loads(raw)
                 base = self._deep_merge(base, user_cfg)
+                self._last_written_hash = hash(raw)
             except (json.JSONDecodeError, OSError) as exc:
                 print(f"[WARNING] Failed to read {self.path}: {exc}. Using defaults.")
         else:
             self.save(base)
         self._data = base
+        self._prompts_cache = None
+        self._refresh()
         return self._data
 
     def save(self, data: dict[str, Any] | None = None) -> None:
-        """Persist current (or provided) config to disk."""
+        """Persist current (or provided) config to disk.
+
+        The write is skipped when the serialized config matches what is
+        already on disk, and otherwise goes through a temp file + rename so
+        an interrupted save never leaves a truncated config.json behind.
+        """
         payload = data if data is not None else self._data
+        if data is None:
+            self._dirty = False
+        raw = _dumps(payload)
+        digest = hash(raw)
+        if digest == self._last_written_hash:
+            return
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.path, "w", encoding="utf-8") as fh:
-            json.dump(payload, fh, indent=4, ensure_ascii=False)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp.write_bytes(raw)
+            os.replace(tmp, self.path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
+        self._last_written_hash = digest
 
     def get(self, key: str, default: Any = None) -> Any:
         return self._data.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         self._data[key] = value
-        self.save()
+        if key == "system_prompts":
+            self._prompts_cache = None
+        self._refresh()
+        self._persist()
+
+    @contextmanager
+    def batch(self) -> Iterator[ConfigManager]:
+        """Defer saving until the outermost batch exits, then write once."""
+        self._batch += 1
+        try:
+            yield self
+        finally:
+            self._batch -= 1
+            if not self._batch and self._dirty:
+                self.save()
 
     @property
     def data(self) -> dict[str, Any]:
@@ -107,63 +191,103 @@ class ConfigManager:
 
     @property
     def instances(self) -> int:
-        return int(self._data.get("instances", 3))
+        return self._instances
 
     @property
     def rounds(self) -> int:
-        return int(self._data.get("rounds", 3))
+        return self._rounds
 
     @property
     def models(self) -> list[str]:
         return self._data.setdefault("models", [])
 
+    @property
+    def models_signature(self) -> tuple[str, ...]:
+        """The models actually in use, as a hashable tuple for change checks."""
+        return tuple(self.models[: self.instances])
+
     def set_model_at(self, index: int, model_name: str) -> None:
-        """Set a specific model by index and persist immediately."""
+        """Set a specific model by index and persist (deferred inside batch())."""
         models = self.models
-        while len(models) <= index:
-            models.append(models[-1] if models else "llama3.2")
+        if index >= len(models):
+            filler = models[-1] if models else "llama3.2"
+            models.extend([filler] * (index + 1 - len(models)))
+        elif models[index] == model_name:
+            return
         models[index] = model_name
-        self.save()
+        self._persist()
 
     @property
     def context_limit(self) -> int:
-        return int(self._data.get("context_limit", 4096))
+        return self._context_limit
 
     @property
     def context_strategy(self) -> str:
-        return str(self._data.get("context_strategy", "sliding_window"))
+        return self._context_strategy
 
     @property
     def skeptic_agent(self) -> bool:
-        return bool(self._data.get("skeptic_agent", True))
+        return self._skeptic_agent
 
     @property
     def system_prompts(self) -> dict[str, str]:
-        return dict(self._data.get("system_prompts", DEFAULT_CONFIG["system_prompts"]))
+        """Prompt table, built once and reused until the prompts change.
+
+        Callers must treat the returned dict as read-only.
+        """
+        if self._prompts_cache is None:
+            self._prompts_cache = dict(
+                self._data.get("system_prompts", DEFAULT_CONFIG["system_prompts"])
+            )
+        return self._prompts_cache
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
+    def _refresh(self) -> None:
+        """Re-derive the typed settings read on every debate turn."""
+        data = self._data
+        self._instances = int(data.get("instances", 3))
+        self._rounds = int(data.get("rounds", 3))
+        self._context_limit = int(data.get("context_limit", 4096))
+        self._context_strategy = str(data.get("context_strategy", "sliding_window"))
+        self._skeptic_agent = bool(data.get("skeptic_agent", True))
+
+    def _persist(self) -> None:
+        """Save now, or mark dirty if inside a batch()."""
+        if self._batch:
+            self._dirty = True
+        else:
+            self.save()
+
     @staticmethod
     def _deep_merge(base: dict, override: dict) -> dict:
-        """Recursively merge *override* into *base*."""
-        merged = copy.deepcopy(base)
-        for key, value in override.items():
-            if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                merged[key] = ConfigManager._deep_merge(merged[key], value)
-            else:
-                merged[key] = copy.deepcopy(value)
-        return merged
+        """Merge *override* into *base* in place and return *base*.
+
+        *base* must be a private copy; values from *override* are stored by
+        reference, which is safe because it comes straight from json.load().
+        """
+        stack = [(base, override)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                if isinstance(value, dict) and isinstance(dst.get(key), dict):
+                    stack.append((dst[key], value))
+                else:
+                    dst[key] = value
+        return base
 
     def ensure_models_match_instances(self) -> None:
         """Pad or trim the models list so it matches the instance count."""
         models = self.models
         n = self.instances
+        if len(models) == n:
+            return
         if len(models) < n:
             filler = models[-1] if models else "llama3.2"
             models.extend([filler] * (n - len(models)))
         elif len(models) > n:
-            models = models[:n]
+            del models[n:]
         self._data["models"] = models
-        self.save()
+        self._persist()
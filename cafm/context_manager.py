@@ -2,25 +2,72 @@
 
 from __future__ import annotations
 
+import io
+from functools import lru_cache
 from typing import Any
 
+try:  # optional: closer BPE-based token estimates
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 
 # Rough estimator: 1 token ≈ 4 characters (English). Conservative enough for safety.
 CHARS_PER_TOKEN = 4
 
+# Per-message role/formatting overhead, in tokens.
+MESSAGE_OVERHEAD = 4
+
+# Head-room left by sliding_window for estimation error. Kept the same with
+# tiktoken: cl100k_base is not the tokenizer of the local models, so its
+# counts are still only an estimate.
+SAFETY_MARGIN = 64
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """Return the cl100k_base encoder, or None if tiktoken is unusable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # e.g. the BPE file cannot be fetched on an offline machine
+        return None
+
+
+# Strings up to this length (system prompts, short replies) have their BPE
+# count memoised; longer ones, like rendered transcripts, are counted
+# afresh so the cache never holds on to whole debates.
+MEMO_MAX_CHARS = 4096
+
+
+@lru_cache(maxsize=256)
+def _bpe_count_memo(text: str) -> int:
+    return len(_encoding().encode(text, disallowed_special=()))
+
+
+def _count_tokens(text: str) -> int:
+    """Token count for *text*: cl100k_base when available, else len // 4."""
+    enc = _encoding()
+    if enc is None:
+        return len(text) // CHARS_PER_TOKEN
+    if len(text) <= MEMO_MAX_CHARS:
+        return _bpe_count_memo(text)
+    return len(enc.encode(text, disallowed_special=()))
+
 
 def estimate_tokens(text: str) -> int:
-    """Cheap token estimate based on character count."""
-    return max(1, len(text) // CHARS_PER_TOKEN)
+    """Token estimate: cl100k_base count when tiktoken is installed, else character-based."""
+    return max(1, _count_tokens(text))
 
 
 def estimate_messages_tokens(messages: list[dict[str, str]]) -> int:
     """Estimate total tokens across a list of chat messages."""
-    total = 0
-    for msg in messages:
-        # Role overhead ≈ 4 tokens
-        total += 4 + estimate_tokens(msg.get("content", ""))
-    return total
+    return sum(
+        MESSAGE_OVERHEAD + _count_tokens(msg.get("content", ""))
+        for msg in messages
+    )
 
 
 def build_transcript(entries: list[dict[str, Any]]) -> str:
@@ -28,11 +75,49 @@ def build_transcript(entries: list[dict[str, Any]]) -> str:
 
     Each entry: {"model": str, "round": int, "content": str}
     """
-    lines: list[str] = []
+    buf = io.StringIO()
+    w = buf.write  # bound once; this loop runs per entry on every turn
+    sep = ""
     for e in entries:
-        header = f"[{e['model']} - Round {e['round']}]"
-        lines.append(f"{header}:\n{e['content']}\n")
-    return "\n".join(lines)
+        w(sep)
+        w("[")
+        w(e["model"])
+        w(" - Round ")
+        w(str(e["round"]))
+        w("]:\n")
+        w(e["content"])
+        w("\n")
+        sep = "\n"
+    return buf.getvalue()
+
+
+class TranscriptCache:
+    """Incrementally rendered transcript for an append-only entry list.
+
+    ``render(entries)`` formats only the entries added since the previous
+    call and returns the same text ``build_transcript(entries)`` would.
+    Call ``clear()`` before reusing the cache for a new debate.
+    """
+
+    __slots__ = ("_count", "_text")
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._text = ""
+
+    def clear(self) -> None:
+        self._count = 0
+        self._text = ""
+
+    def render(self, entries: list[dict[str, Any]]) -> str:
+        if len(entries) < self._count:
+            # Not the list we were tracking — start over.
+            self.clear()
+        if len(entries) > self._count:
+            new = build_transcript(entries[self._count:])
+            self._text = f"{self._text}\n{new}" if self._text else new
+            self._count = len(entries)
+        return self._text
 
 
 def sliding_window(
@@ -51,33 +136,35 @@ def sliding_window(
     reserved = messages[:2]
     rest = messages[2:]
 
-    budget = limit - estimate_messages_tokens(reserved) - 64  # safety margin
+    budget = limit - estimate_messages_tokens(reserved) - SAFETY_MARGIN
     if budget <= 0:
         return reserved
 
-    # Walk backwards through the rest, adding as many as fit
-    included: list[dict[str, str]] = []
-    for msg in reversed(rest):
-        cost = estimate_messages_tokens([msg])
-        if budget - cost < 0:
+    # Walk backwards through the rest, keeping the longest suffix that fits
+    costs = [MESSAGE_OVERHEAD + _count_tokens(msg.get("content", "")) for msg in rest]
+    start = len(rest)
+    for i in range(len(rest) - 1, -1, -1):
+        if budget - costs[i] < 0:
             break
-        included.insert(0, msg)
-        budget -= cost
+        budget -= costs[i]
+        start = i
 
-    return reserved + included
+    return reserved + rest[start:]
 
 
 def summarize_transcript(
     entries: list[dict[str, Any]],
     summary_func,
     limit: int,
+    transcript_text: str | None = None,
 ) -> str:
     """Produce a condensed summary of the debate so far.
 
     *summary_func* is a callable(model, messages, ctx) -> str (e.g. chat_sync).
+    *transcript_text* may carry an already rendered transcript of *entries*.
     Falls back to a naive truncation if the summary call fails.
     """
-    full = build_transcript(entries)
+    full = transcript_text if transcript_text is not None else build_transcript(entries)
     prompt_messages = [
         {
             "role": "system",
@@ -108,9 +195,13 @@ def prepare_messages(
     context_limit: int,
     strategy: str = "sliding_window",
     summary_func=None,
+    transcript_cache: TranscriptCache | None = None,
 ) -> list[dict[str, str]]:
     """Build the message list for a model call, respecting the context budget.
 
+    Pass a *transcript_cache* when called repeatedly with a growing entry
+    list so earlier entries are not re-rendered on every turn.
+
     Returns a list of {role, content} dicts ready for ollama.chat().
     """
     messages: list[dict[str, str]] = [
@@ -118,8 +209,12 @@ def prepare_messages(
         {"role": "user", "content": f"User Query: {user_query}"},
     ]
 
+    transcript_text: str | None = None
     if transcript_entries:
-        transcript_text = build_transcript(transcript_entries)
+        if transcript_cache is not None:
+            transcript_text = transcript_cache.render(transcript_entries)
+        else:
+            transcript_text = build_transcript(transcript_entries)
         messages.append(
             {"role": "user", "content": f"Debate transcript so far:\n\n{transcript_text}"}
         )
@@ -132,7 +227,8 @@ def prepare_messages(
     # Strategy: sliding_window or summary
     if strategy == "summary" and summary_func is not None:
         summary = summarize_transcript(
-            transcript_entries, summary_func, context_limit // 2
+            transcript_entries, summary_func, context_limit // 2,
+            transcript_text=transcript_text,
         )
         messages = [
             {"role": "system", "content": system_prompt},
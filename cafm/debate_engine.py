@@ -3,16 +3,26 @@
 from __future__ import annotations
 
 import json
-import sys
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Any, Callable
 
 import re
 
-from rich.console import Console
+try:  # optional: faster JSON encoding of session logs
+    import orjson
+except ImportError:
+    orjson = None
+
+from rich.console import Console, Group
 from rich.live import Live
-from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.text import Text
 
@@ -22,32 +32,48 @@ from cafm.config_manager import ConfigManager
 AGENT_COLORS = ["cyan", "yellow", "magenta", "blue", "green", "red"]
 AGENT_BOLD   = ["bold cyan", "bold yellow", "bold magenta", "bold blue", "bold green", "bold red"]
 
-_SPANISH_RE = re.compile(
-    r'[\u00e1\u00e9\u00ed\u00f3\u00fa\u00fc\u00f1\u00bf\u00a1]|'
-    r'\b(que|est\u00e1|es|en|de|la|el|los|las|con|por|para|una|uno|pero|como|m\u00e1s|'
-    r'tambi\u00e9n|sobre|muy|tiene|hacer|qu\u00e9|c\u00f3mo|cu\u00e1l|esto|eso|son|hay|si)\b',
-    re.IGNORECASE,
-)
+# Minimum interval between redraws of a streaming response (~12 fps).
+STREAM_REFRESH_SECONDS = 1 / 12
+
+_SPANISH_WORDS = frozenset((
+    "que", "est\u00e1", "es", "en", "de", "la", "el", "los", "las", "con", "por",
+    "para", "una", "uno", "pero", "como", "m\u00e1s", "tambi\u00e9n", "sobre", "muy",
+    "tiene", "hacer", "qu\u00e9", "c\u00f3mo", "cu\u00e1l", "esto", "eso", "son", "hay", "si",
+))
+_SPANISH_MARKS = frozenset("\u00e1\u00e9\u00ed\u00f3\u00fa\u00fc\u00f1\u00bf\u00a1")
+# Words, plus the inverted marks (which are not word characters).
+_TOKEN_RE = re.compile(r"\w+|[\u00bf\u00a1]")
 
 
 def detect_language(text: str) -> str:
-    """Return 'Spanish' if the text appears to be Spanish, otherwise 'English'."""
-    return "Spanish" if len(_SPANISH_RE.findall(text)) >= 2 else "English"
-from cafm.context_manager import prepare_messages
-from cafm.ollama_client import chat_stream, chat_sync
+    """Return 'Spanish' if the text appears to be Spanish, otherwise 'English'.
+
+    A token scores one hit if it is a common Spanish word, otherwise one hit
+    per Spanish-only character it contains; two hits decide it.
+    """
+    hits = 0
+    for match in _TOKEN_RE.finditer(text.lower()):
+        token = match.group()
+        if token in _SPANISH_WORDS:
+            hits += 1
+        elif not token.isascii():
+            hits += sum(ch in _SPANISH_MARKS for ch in token)
+        if hits >= 2:
+            return "Spanish"
+    return "English"
+from cafm.context_manager import TranscriptCache, prepare_messages
+from cafm.ollama_client import chat_stream, chat_sync, warm_up_models
 
 console = Console()
 
 
+@dataclass(slots=True)
 class DebateEntry:
     """One turn in the debate."""
 
-    __slots__ = ("model", "round_num", "content")
-
-    def __init__(self, model: str, round_num: int, content: str) -> None:
-        self.model = model
-        self.round_num = round_num
-        self.content = content
+    model: str
+    round_num: int
+    content: str
 
     def as_dict(self) -> dict[str, Any]:
         return {"model": self.model, "round": self.round_num, "content": self.content}
@@ -59,7 +85,12 @@ class DebateEngine:
     def __init__(self, config: ConfigManager) -> None:
         self.config = config
         self.transcript: list[DebateEntry] = []
+        # as_dict() view of self.transcript, kept in lockstep by _record()
+        self._transcript_dicts: list[dict[str, Any]] = []
+        self._log_thread: threading.Thread | None = None
+        self._log_error: str | None = None
         self.user_query: str = ""
+        self._transcript_cache = TranscriptCache()
 
     # ------------------------------------------------------------------
     # Main entry
@@ -67,8 +98,11 @@ class DebateEngine:
 
     def run(self, query: str) -> str:
         """Execute the full debate and return the final synthesised answer."""
+        self.wait_for_log()
         self.user_query = query
         self.transcript.clear()
+        self._transcript_dicts.clear()  # the previous log write has finished
+        self._transcript_cache.clear()
 
         models = self.config.models
         n_rounds = self.config.rounds
@@ -77,6 +111,7 @@ class DebateEngine:
         ctx_limit = self.config.context_limit
         strategy = self.config.context_strategy
         stream = self.config.data.get("stream_output", True)
+        parallel = self.config.data.get("parallel_agents", False)
         skeptic = self.config.skeptic_agent and n_instances > 1
         skeptic_idx = n_instances - 1  # last agent is the skeptic
 
@@ -99,39 +134,70 @@ class DebateEngine:
         console.print(f"  Rounds   : {n_rounds}  |  Skeptic: [bold]{'ON' if skeptic else 'OFF'}[/bold]")
         console.rule()
 
+        if self.config.data.get("warm_up_models", False):
+            warm_up_models(models[:n_instances], ctx_limit, self.config.data.get("keep_alive"))
+
+        summary_func = self._make_summary_func()
+        # Agents that share a system prompt and see the same transcript get
+        # the same messages (the common case for parallel peers), so keep
+        # the lists built for the current transcript length and reuse them.
+        prepared: dict[tuple[int, str], list[dict[str, str]]] = {}
+
+        # System prompts are fixed for the whole run, keyed by
+        # (is_skeptic, is_first_round).
+        round_prompts = {
+            (True, True): prompts.get("skeptic_initial_round", prompts.get("skeptic_round", "")),
+            (True, False): prompts.get("skeptic_round", prompts.get("debate_round", "")),
+            (False, True): prompts.get("initial_round", ""),
+            (False, False): prompts.get("debate_round", ""),
+        }
+        round_prompts = {k: sp + lang_note for k, sp in round_prompts.items()}
+
+        def agent_messages(idx: int, is_first: bool) -> list[dict[str, str]]:
+            sp = round_prompts[skeptic and idx == skeptic_idx, is_first]
+            key = (len(self.transcript), sp)
+            messages = prepared.get(key)
+            if messages is None:
+                if prepared and next(iter(prepared))[0] != key[0]:
+                    prepared.clear()  # transcript moved on; old lists are stale
+                messages = prepared[key] = prepare_messages(
+                    system_prompt=sp,
+                    user_query=query,
+                    transcript_entries=self._transcript_dicts,
+                    context_limit=ctx_limit,
+                    strategy=strategy,
+                    summary_func=summary_func,
+                    transcript_cache=self._transcript_cache,
+                )
+            return messages
+
         # ── Debate rounds — ALL agents speak in EVERY round ───────────
         for rnd in range(1, n_rounds + 1):
             is_first = rnd == 1
             console.print()
             console.rule(f"[bold yellow]Round {rnd} / {n_rounds}[/bold yellow]")
 
-            for idx in range(n_instances):
+            sequential = list(range(n_instances))
+            if parallel:
+                # Non-skeptic agents answer concurrently from the transcript as
+                # it stood at the start of the round; the skeptic goes last so
+                # it can still attack this round's answers.
+                peers = [i for i in sequential if not (skeptic and i == skeptic_idx)]
+                if len(peers) > 1:
+                    jobs = [(i, models[i], partial(agent_messages, i, is_first)) for i in peers]
+                    contents = self._generate_parallel(jobs, rnd, stream)
+                    for (_, model, _), content in zip(jobs, contents):
+                        self._record(DebateEntry(model, rnd, content))
+                    sequential = [skeptic_idx] if skeptic else []
+
+            for idx in sequential:
                 model = models[idx]
-                is_this_skeptic = skeptic and idx == skeptic_idx
-
-                if is_this_skeptic and is_first:
-                    sp = prompts.get("skeptic_initial_round", prompts.get("skeptic_round", ""))
-                elif is_this_skeptic:
-                    sp = prompts.get("skeptic_round", prompts.get("debate_round", ""))
-                elif is_first:
-                    sp = prompts.get("initial_round", "")
-                else:
-                    sp = prompts.get("debate_round", "")
-
-                messages = prepare_messages(
-                    system_prompt=sp + lang_note,
-                    user_query=query,
-                    transcript_entries=[e.as_dict() for e in self.transcript],
-                    context_limit=ctx_limit,
-                    strategy=strategy,
-                    summary_func=self._make_summary_func(),
-                )
                 content = self._generate(
-                    model, messages, rnd, stream,
+                    model, agent_messages(idx, is_first), rnd, stream,
                     agent_idx=idx,
-                    is_skeptic=is_this_skeptic,
+                    is_skeptic=skeptic and idx == skeptic_idx,
                 )
-                self.transcript.append(DebateEntry(model, rnd, content))
+                self._record(DebateEntry(model, rnd, content))
 
         # ── Final synthesis — separate step after all rounds ──────────
         console.print()
@@ -141,16 +207,17 @@ class DebateEngine:
         messages = prepare_messages(
             system_prompt=synth_prompt,
             user_query=query,
-            transcript_entries=[e.as_dict() for e in self.transcript],
+            transcript_entries=self._transcript_dicts,
             context_limit=ctx_limit,
             strategy=strategy,
-            summary_func=self._make_summary_func(),
+            summary_func=summary_func,
+            transcript_cache=self._transcript_cache,
         )
         final_content = self._generate(
             final_model, messages, n_rounds + 1, stream,
             agent_idx=0, is_synthesis=True,
         )
-        self.transcript.append(DebateEntry(final_model, n_rounds + 1, final_content))
+        self._record(DebateEntry(final_model, n_rounds + 1, final_content))
 
         # Save log if configured
         if self.config.data.get("save_logs", False):
@@ -173,6 +240,171 @@ class DebateEngine:
         is_skeptic: bool = False,
     ) -> str:
         """Generate a single model response (streaming or sync)."""
+        title, border, text_color = self._panel_style(
+            model, rnd, agent_idx, is_synthesis, is_skeptic
+        )
+
+        console.print()
+        console.print(Panel("", title=title, border_style=border, padding=(0, 1)))
+
+        if stream:
+            return self._stream_generate(model, messages, text_color)
+        else:
+            content = chat_sync(
+                model, messages, self.config.context_limit, self.config.data.get("keep_alive")
+            )
+            console.print(content, style=text_color)
+            return content
+
+    def _generate_parallel(
+        self,
+        jobs: list[tuple[int, str, Callable[[], list[dict]]]],
+        rnd: int,
+        stream: bool,
+    ) -> list[str]:
+        """Run several (agent_idx, model, prepare_messages) jobs concurrently.
+
+        Each job's messages are built just before it is submitted, so the
+        preparation of later jobs (including any summary call) overlaps with
+        generation of the earlier ones. Results come back in job order.
+        When streaming, each agent gets its own panel inside one Live
+        display; worker threads only push tokens onto a queue and the main
+        thread owns all rendering.
+        """
+        ctx_limit = self.config.context_limit
+        keep_alive = self.config.data.get("keep_alive")
+        styles = [self._panel_style(model, rnd, idx) for idx, model, _ in jobs]
+
+        # Submit same-model jobs back to back: Ollama batches concurrent
+        # requests on a loaded runner, and grouping them avoids swapping
+        # models between requests when only one model fits in memory.
+        rank = {m: r for r, m in enumerate(dict.fromkeys(model for _, model, _ in jobs))}
+        submit_order = sorted(range(len(jobs)), key=lambda pos: rank[jobs[pos][1]])
+
+        # Workers always stream so they can notice ``stop`` between tokens
+        # and close the generator, which releases the HTTP connection.
+        # A blocking chat_sync call could not be abandoned on Ctrl-C.
+        stop = threading.Event()
+        tokens: queue.Queue[tuple[int, str | None]] = queue.Queue()
+
+        def pump(pos: int, model: str, messages: list[dict]) -> str:
+            parts: list[str] = []
+            gen = chat_stream(model, messages, ctx_limit, keep_alive)
+            try:
+                for token in gen:
+                    if stop.is_set():
+                        break
+                    parts.append(token)
+                    if stream:
+                        tokens.put((pos, token))
+            finally:
+                gen.close()
+                if stream:
+                    tokens.put((pos, None))  # end-of-stream marker
+            return "".join(parts)
+
+        pool = ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="cafm-agent")
+        try:
+            futures = {}
+            for pos in submit_order:
+                futures[pos] = pool.submit(pump, pos, jobs[pos][1], jobs[pos][2]())
+
+            if not stream:
+                results = [futures[pos].result() for pos in range(len(jobs))]
+                for (title, border, color), content in zip(styles, results):
+                    console.print()
+                    console.print(Panel("", title=title, border_style=border, padding=(0, 1)))
+                    console.print(content, style=color)
+            else:
+                buffers = [Text(style=color) for _, _, color in styles]
+                panels = Group(*(
+                    Panel(buf, title=title, border_style=border, padding=(0, 1))
+                    for buf, (title, border, _) in zip(buffers, styles)
+                ))
+                running = len(jobs)
+                console.print()
+                last = time.monotonic()
+                with Live(panels, console=console, auto_refresh=False, vertical_overflow="visible") as live:
+                    dirty = False
+                    while running:
+                        try:
+                            pos, token = tokens.get(timeout=STREAM_REFRESH_SECONDS)
+                        except queue.Empty:
+                            # Quiet spell: draw whatever is still pending.
+                            if dirty:
+                                live.refresh()
+                                dirty = False
+                                last = time.monotonic()
+                            continue
+                        if token is None:
+                            # An agent finished; show its tail right away.
+                            running -= 1
+                            live.refresh()
+                            dirty = False
+                            last = time.monotonic()
+                            continue
+                        buffers[pos].append(token)
+                        dirty = True
+                        now = time.monotonic()
+                        if now - last >= STREAM_REFRESH_SECONDS:
+                            live.refresh()
+                            dirty = False
+                            last = now
+                results = [futures[pos].result() for pos in range(len(jobs))]
+        except BaseException:
+            # Ctrl-C or a failed job: tell the workers to stop and return
+            # immediately instead of waiting for every answer to finish.
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        pool.shutdown()
+        return results
+
+    def _stream_generate(self, model: str, messages: list[dict], color: str = "white") -> str:
+        """Stream tokens to console and accumulate result.
+
+        Text is written straight through to the terminal instead of being
+        re-rendered from a growing buffer, so each update costs the same no
+        matter how long the response already is. Tokens are still batched
+        into writes at most STREAM_REFRESH_SECONDS apart.
+        """
+        collected: list[str] = []
+        pending: list[str] = []
+        last = time.monotonic()
+
+        keep_alive = self.config.data.get("keep_alive")
+        for token in chat_stream(model, messages, self.config.context_limit, keep_alive):
+            collected.append(token)
+            pending.append(token)
+            now = time.monotonic()
+            if now - last >= STREAM_REFRESH_SECONDS:
+                console.out("".join(pending), style=color, end="", highlight=False)
+                pending.clear()
+                last = now
+        if pending:
+            console.out("".join(pending), style=color, end="", highlight=False)
+        console.out("")
+
+        return "".join(collected)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _record(self, entry: DebateEntry) -> None:
+        """Append *entry* to the transcript and its dict view."""
+        self.transcript.append(entry)
+        self._transcript_dicts.append(entry.as_dict())
+
+    @staticmethod
+    def _panel_style(
+        model: str,
+        rnd: int,
+        agent_idx: int,
+        is_synthesis: bool = False,
+        is_skeptic: bool = False,
+    ) -> tuple[str, str, str]:
+        """Return (title, border_style, text_color) for an agent's panel."""
         color = AGENT_COLORS[agent_idx % len(AGENT_COLORS)]
         bold  = AGENT_BOLD[agent_idx % len(AGENT_BOLD)]
 
@@ -191,33 +423,8 @@ class DebateEngine:
                 f"[{bold}] Agent {agent_idx+1} [{color}]— {model}[/{color}] — Round {rnd} [{bold}][/]"
             )
 
-        console.print()
-        console.print(Panel("", title=title, border_style=border, padding=(0, 1)))
-
         text_color = "red" if is_skeptic else ("green" if is_synthesis else color)
-        if stream:
-            return self._stream_generate(model, messages, text_color)
-        else:
-            content = chat_sync(model, messages, self.config.context_limit)
-            console.print(content, style=text_color)
-            return content
-
-    def _stream_generate(self, model: str, messages: list[dict], color: str = "white") -> str:
-        """Stream tokens to console and accumulate result."""
-        collected: list[str] = []
-        buffer = Text(style=color)
-
-        with Live(buffer, console=console, refresh_per_second=12, vertical_overflow="visible") as live:
-            for token in chat_stream(model, messages, self.config.context_limit):
-                collected.append(token)
-                buffer.append(token, style=color)
-                live.update(buffer)
-
-        return "".join(collected)
-
-    # ------------------------------------------------------------------
-    # Helpers
-    # ------------------------------------------------------------------
+        return title, border, text_color
 
     def _make_summary_func(self) -> Callable | None:
         """Return a summary callable for the context manager, or None."""
@@ -226,14 +433,20 @@ class DebateEngine:
         )
         if summary_model is None:
             return None
+        keep_alive = self.config.data.get("keep_alive")
 
         def _summarise(messages: list[dict[str, str]]) -> str:
-            return chat_sync(summary_model, messages, self.config.context_limit)
+            return chat_sync(summary_model, messages, self.config.context_limit, keep_alive)
 
         return _summarise
 
     def _save_log(self) -> None:
-        """Persist the full debate transcript as a JSON file."""
+        """Persist the full debate transcript as a JSON file.
+
+        The payload is assembled here; encoding and writing happen on a
+        non-daemon thread, so the CLI returns to the prompt immediately
+        and the interpreter still finishes the write before exiting.
+        """
         log_dir = Path(self.config.data.get("log_directory", "logs"))
         log_dir.mkdir(parents=True, exist_ok=True)
         ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
@@ -242,14 +455,44 @@ class DebateEngine:
             "timestamp": ts,
             "query": self.user_query,
             "config": {
-                "models": self.config.models,
+                "models": list(self.config.models),
                 "instances": self.config.instances,
                 "rounds": self.config.rounds,
                 "context_limit": self.config.context_limit,
                 "context_strategy": self.config.context_strategy,
             },
-            "transcript": [e.as_dict() for e in self.transcript],
+            "transcript": self._transcript_dicts,
         }
-        with open(path, "w", encoding="utf-8") as fh:
-            json.dump(payload, fh, indent=2, ensure_ascii=False)
-        console.print(f"\n[dim]Session log saved to {path}[/dim]")
+        self._log_thread = threading.Thread(
+            target=self._write_log, args=(path, payload), name="cafm-save-log"
+        )
+        self._log_thread.start()
+        console.print(f"\n[dim]Saving session log to {path}[/dim]")
+
+    def wait_for_log(self) -> None:
+        """Block until the last session log is written; report any failure.
+
+        Write errors are kept by the writer thread and printed here, on the
+        calling thread, so they never interleave with a prompt.
+        """
+        if self._log_thread is not None:
+            self._log_thread.join()
+            self._log_thread = None
+        if self._log_error is not None:
+            console.print(f"[red]{self._log_error}[/red]")
+            self._log_error = None
+
+    def _write_log(self, path: Path, payload: dict[str, Any]) -> None:
+        if orjson is not None:
+            raw = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        else:
+            raw = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+        # Write to a sibling and rename, so a crash never leaves a
+        # truncated log under the final name.
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            tmp.write_bytes(raw)
+            os.replace(tmp, path)
+        except OSError as exc:
+            tmp.unlink(missing_ok=True)
+            self._log_error = f"Failed to save session log {path}: {exc}"
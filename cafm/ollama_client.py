@@ -2,20 +2,55 @@
 
 from __future__ import annotations
 
+import functools
 import sys
-from typing import Generator
+import threading
+from types import MappingProxyType
+from typing import Any, Generator, Mapping
 
+import httpx
 import ollama
 
+# One client for the whole process so every call reuses pooled keep-alive
+# connections. The host comes from OLLAMA_HOST, as with ollama's own
+# default client; idle connections are kept long enough to survive the
+# pause between one query and the next.
+_CLIENT = ollama.Client(
+    limits=httpx.Limits(
+        max_keepalive_connections=8,
+        max_connections=16,
+        keepalive_expiry=120,
+    ),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _local_models() -> tuple[str, ...]:
+    """Fetch the local model list once; see refresh_local_models().
+
+    Failures raise and are therefore not cached.
+    """
+    response = _CLIENT.list()
+    return tuple(sorted(m.model for m in response.models))
+
+
+def refresh_local_models() -> None:
+    """Forget the cached model list so the next lookup asks the server."""
+    _local_models.cache_clear()
+
 
 def list_local_models() -> list[str]:
     """Return sorted list of model names available in the local Ollama instance."""
     try:
-        response = ollama.list()
-        return sorted(m.model for m in response.models)
+        models = _local_models()
     except Exception as exc:
         print(f"[ERROR] Cannot reach Ollama server: {exc}")
         return []
+    if not models:
+        # Don't remember an empty list: the server may still be starting,
+        # or models may be pulled outside this process.
+        refresh_local_models()
+    return list(models)
 
 
 def validate_models(required: list[str]) -> tuple[list[str], list[str]]:
@@ -23,13 +58,13 @@ def validate_models(required: list[str]) -> tuple[list[str], list[str]]:
 
     Returns (available, missing).
     """
-    local = list_local_models()
-    # Normalise: ollama.list() may return tags like "llama3.2:latest"
-    local_base = {m.split(":")[0]: m for m in local}
+    local = set(list_local_models())
+    # Normalise: ollama may return tags like "llama3.2:latest"
+    local_base = {m.split(":", 1)[0] for m in local}
     available: list[str] = []
     missing: list[str] = []
     for model in required:
-        base = model.split(":")[0]
+        base = model.split(":", 1)[0]
         if model in local or base in local_base:
             available.append(model)
         else:
@@ -41,31 +76,80 @@ def pull_model(model: str) -> bool:
     """Attempt to pull a model via Ollama. Returns True on success."""
     try:
         print(f"  Pulling {model} …")
-        ollama.pull(model)
+        _CLIENT.pull(model)
+        refresh_local_models()
         return True
     except Exception as exc:
         print(f"  [ERROR] Failed to pull {model}: {exc}")
         return False
 
 
+@functools.lru_cache(maxsize=8)
+def _options(context_limit: int) -> Mapping[str, Any]:
+    """Shared read-only request options for a given context size."""
+    return MappingProxyType({"num_ctx": context_limit})
+
+
+def warm_up_models(
+    models: list[str],
+    context_limit: int = 4096,
+    keep_alive: str | int | None = None,
+) -> None:
+    """Start loading the distinct models in *models* without waiting.
+
+    One daemon thread loads them in the given (agent) order, one at a time,
+    so the first agent's model is requested first and a later load never
+    races ahead of it. Only worth enabling when all the models fit in
+    memory together; otherwise each load evicts the previous one. Errors
+    are ignored: the real request for that model will report them.
+    """
+    threading.Thread(
+        target=_load_models,
+        args=(list(dict.fromkeys(models)), context_limit, keep_alive),
+        name="cafm-warm-up",
+        daemon=True,
+    ).start()
+
+
+def _load_models(models: list[str], context_limit: int, keep_alive: str | int | None) -> None:
+    for model in models:
+        try:
+            # num_ctx must match the chat calls or Ollama reloads the runner.
+            _CLIENT.generate(
+                model=model,
+                prompt="",
+                options=_options(context_limit),
+                keep_alive=keep_alive,
+            )
+        except Exception:
+            pass
+
+
+# Shared stand-in for a missing "message" field; never mutated.
+_EMPTY: dict[str, str] = {}
+
+
 def chat_stream(
     model: str,
     messages: list[dict[str, str]],
     context_limit: int = 4096,
+    keep_alive: str | int | None = None,
 ) -> Generator[str, None, None]:
     """Stream a chat completion token-by-token.
 
-    Yields content chunks as they arrive.
+    Yields content chunks as they arrive. *keep_alive* is how long Ollama
+    keeps the model loaded afterwards; None leaves it to the server.
     """
     try:
-        stream = ollama.chat(
+        stream = _CLIENT.chat(
             model=model,
             messages=messages,
             stream=True,
-            options={"num_ctx": context_limit},
+            options=_options(context_limit),
+            keep_alive=keep_alive,
         )
         for chunk in stream:
-            token = chunk.get("message", {}).get("content", "")
+            token = (chunk.get("message") or _EMPTY).get("content")
             if token:
                 yield token
     except Exception as exc:
@@ -76,15 +160,17 @@ def chat_sync(
     model: str,
     messages: list[dict[str, str]],
     context_limit: int = 4096,
+    keep_alive: str | int | None = None,
 ) -> str:
     """Non-streaming chat completion. Returns full content string."""
     try:
-        resp = ollama.chat(
+        resp = _CLIENT.chat(
             model=model,
             messages=messages,
             stream=False,
-            options={"num_ctx": context_limit},
+            options=_options(context_limit),
+            keep_alive=keep_alive,
         )
-        return resp.get("message", {}).get("content", "")
+        return (resp.get("message") or _EMPTY).get("content") or ""
     except Exception as exc:
         return f"[ERROR] Model {model} failed: {exc}"